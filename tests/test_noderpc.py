@@ -0,0 +1,148 @@
+import json
+import time
+
+import pytest
+
+from vizapi import exceptions
+from vizapi.noderpc import NodeRPC, Rpc
+
+
+class EchoRpc(Rpc):
+    """Rpc with a canned rpcexec which records payloads and echoes query params as results."""
+
+    def __init__(self):
+        super().__init__("http://localhost")
+        self.payloads = []
+
+    def rpcexec(self, payload):
+        self.payloads.append(payload)
+        if isinstance(payload, list):
+            return json.dumps([{"id": query["id"], "result": query["params"]} for query in payload])
+        return json.dumps({"id": payload["id"], "result": payload["params"]})
+
+
+@pytest.fixture()
+def rpc():
+    return EchoRpc()
+
+
+@pytest.fixture()
+def noderpc():
+    """NodeRPC with a fake connection counting calls; no node needed."""
+    instance = NodeRPC("ws://localhost", connect=False, call_cache_ttl=60)
+    calls = {"count": 0, "result": None}
+
+    class FakeConnection:
+        def __getattr__(self, name):
+            def method(*args, **kwargs):
+                calls["count"] += 1
+                return calls["result"]
+
+            return method
+
+    instance._active_connection = FakeConnection()
+    instance._active_url = instance.url
+    instance.calls = calls
+    return instance
+
+
+def test_batch_single_roundtrip(rpc):
+    with rpc.batch() as batch:
+        config = batch.get_config()
+        props = batch.get_dynamic_global_properties()
+
+    assert len(rpc.payloads) == 1
+    assert [query["method"] for query in rpc.payloads[0]] == ["call", "call"]
+    assert config.result() == ["database_api", "get_config", []]
+    assert props.result() == ["database_api", "get_dynamic_global_properties", []]
+
+
+def test_batch_resolves_by_id(rpc):
+    def shuffled_rpcexec(payload):
+        return json.dumps([{"id": query["id"], "result": query["params"][1]} for query in reversed(payload)])
+
+    rpc.rpcexec = shuffled_rpcexec
+    with rpc.batch() as batch:
+        config = batch.get_config()
+        props = batch.get_dynamic_global_properties()
+
+    assert config.result() == "get_config"
+    assert props.result() == "get_dynamic_global_properties"
+
+
+def test_batch_unknown_method(rpc):
+    with pytest.raises(exceptions.NoSuchAPI):
+        with rpc.batch() as batch:
+            batch.nonexistent_method()
+
+
+def test_batch_error_resolution(rpc):
+    def failing_rpcexec(payload):
+        return json.dumps(
+            [
+                {"id": payload[0]["id"], "result": 42},
+                {"id": payload[1]["id"], "error": {"message": "Execution failure"}},
+            ]
+        )
+
+    rpc.rpcexec = failing_rpcexec
+    with rpc.batch() as batch:
+        good = batch.get_config()
+        bad = batch.get_dynamic_global_properties()
+
+    assert good.result() == 42
+    with pytest.raises(Exception, match="Execution failure"):
+        bad.result()
+
+
+def test_batch_result_before_execute(rpc):
+    batch = rpc.batch()
+    handle = batch.get_config()
+    with pytest.raises(RuntimeError):
+        handle.result()
+
+
+def test_call_cache_hit(noderpc):
+    noderpc.calls["result"] = {"witness": "alice"}
+    first = noderpc.get_block(1)
+    second = noderpc.get_block(1)
+    assert first == second
+    assert noderpc.calls["count"] == 1
+
+    # other arguments and non-whitelisted calls are not served from the cache
+    noderpc.get_block(2)
+    noderpc.get_dynamic_global_properties()
+    noderpc.get_dynamic_global_properties()
+    assert noderpc.calls["count"] == 4
+
+
+def test_call_cache_skips_empty_results(noderpc):
+    noderpc.calls["result"] = None
+    assert noderpc.get_block(1) is None
+    noderpc.calls["result"] = {"witness": "alice"}
+    assert noderpc.get_block(1) == {"witness": "alice"}
+    assert noderpc.calls["count"] == 2
+
+
+def test_call_cache_returns_copies(noderpc):
+    noderpc.calls["result"] = {"witness": "alice"}
+    block = noderpc.get_block(1)
+    block.update({"block_num": 1})
+    assert noderpc.get_block(1) == {"witness": "alice"}
+
+
+def test_call_cache_invalidation(noderpc):
+    noderpc.calls["result"] = {"witness": "alice"}
+    noderpc.get_block(1)
+    noderpc.invalidate_network_cache()
+    noderpc.get_block(1)
+    assert noderpc.calls["count"] == 2
+
+
+def test_call_cache_expiry(noderpc):
+    noderpc._call_cache.max_age = 0.01
+    noderpc.calls["result"] = {"witness": "alice"}
+    noderpc.get_block(1)
+    time.sleep(0.02)
+    noderpc.get_block(1)
+    assert noderpc.calls["count"] == 2
@@ -77,6 +77,13 @@ def test_transfer_to_vesting(viz, default_account):
     viz.transfer_to_vesting(10, to="alice", account=default_account)
 
 
+def test_bundled(viz, default_account):
+    with viz.bundled() as tx:
+        viz.transfer("null", 1, "VIZ", memo="test_bundled 1", account=default_account)
+        viz.transfer("null", 2, "VIZ", memo="test_bundled 2", account=default_account)
+    assert len(tx.broadcast_result["operations"]) == 2
+
+
 def test_set_withdraw_vesting_route(viz):
     viz.set_withdraw_vesting_route("bob", account="alice")
 
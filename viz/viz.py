@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import logging
 from collections import defaultdict
+from contextlib import contextmanager
 from typing import Any, DefaultDict, Dict, List, Optional, Union
 
 from graphenecommon.chain import AbstractGrapheneChain
@@ -22,6 +23,18 @@ from .wallet import Wallet
 
 log = logging.getLogger(__name__)
 
+# Cached lazy import: memo module pulls in heavy crypto deps not needed for plain transfers
+_memo_class = None
+
+
+def _get_memo_class():
+    global _memo_class
+    if _memo_class is None:
+        from .memo import Memo
+
+        _memo_class = Memo
+    return _memo_class
+
 
 class Client(AbstractGrapheneChain):
     """
@@ -75,6 +88,11 @@ class Client(AbstractGrapheneChain):
         print(viz.info())
     """
 
+    # Per-instance caches for chain constants; class-level None works as "not fetched yet"
+    _chain_1_percent: Optional[int] = None
+    _core_symbol: Optional[str] = None
+    _shares_symbol: Optional[str] = None
+
     def define_classes(self):
         from .blockchainobject import BlockchainObject
 
@@ -86,6 +104,96 @@ class Client(AbstractGrapheneChain):
         self.transactionbuilder_class = TransactionBuilder
         self.blockchainobject_class = BlockchainObject
 
+    @property
+    def chain_1_percent(self) -> int:
+        """``CHAIN_1_PERCENT`` node constant; fetched once and cached on the instance."""
+        if self._chain_1_percent is None:
+            self._chain_1_percent = self.rpc.config['CHAIN_1_PERCENT']
+        return self._chain_1_percent
+
+    @property
+    def core_symbol(self) -> str:
+        """Core asset symbol of the connected network (e.g. ``VIZ``)."""
+        if self._core_symbol is None:
+            self._core_symbol = self.rpc.chain_params["core_symbol"]
+        return self._core_symbol
+
+    @property
+    def shares_symbol(self) -> str:
+        """Vesting shares symbol of the connected network (e.g. ``SHARES``)."""
+        if self._shares_symbol is None:
+            self._shares_symbol = self.rpc.chain_params["shares_symbol"]
+        return self._shares_symbol
+
+    @contextmanager
+    def bundled(self):
+        """
+        Bundle operations from several calls into a single transaction.
+
+        Inside the block, op-building methods (:py:meth:`transfer`, :py:meth:`award`, ...) append their operations
+        to the shared transaction buffer instead of signing and broadcasting each one separately. On leaving the
+        block the whole bundle is signed and broadcast as one transaction, i.e. a chain of N calls costs one
+        network round trip instead of N.
+
+        The broadcast return value (the transaction, including the blocking-mode receipt) is stored on the
+        yielded :py:class:`~.transactionbuilder.TransactionBuilder` as ``broadcast_result`` after the block
+        ends. If the block raises, nothing is broadcast and the buffer is cleared.
+
+        .. code-block:: python
+
+            with viz.bundled() as tx:
+                viz.transfer("null", 1, "VIZ", account="alice")
+                viz.award("bob", 10, account="alice")
+            print(tx.broadcast_result)
+
+        .. note:: All bundled operations need to be signable by the same account and permission.
+        """
+        tx = self.txbuffer
+        previous_bundle_mode = self.bundle
+        self.bundle = True
+        try:
+            yield tx
+        except Exception:
+            tx.clear()
+            raise
+        finally:
+            self.bundle = previous_bundle_mode
+        tx.sign()
+        tx.broadcast_result = tx.broadcast()
+
+    def _resolve_account(self, account: Optional[str]) -> str:
+        """
+        Substitute ``default_account`` when the caller did not pass an account.
+
+        :param str account: account name passed by the caller, may be empty
+        :raises ValueError: if neither ``account`` nor ``default_account`` is set
+        """
+        account = account or self.config.get("default_account")
+        if not account:
+            raise ValueError("You need to provide an account")
+        return account
+
+    def _encrypt_memo(self, memo: str, from_account: str, to_account: str) -> str:
+        """
+        Encrypt a ``#``-prefixed memo; kept out of :py:meth:`transfer` as the cold path.
+
+        :param str memo: plaintext memo starting with ``#``
+        :param str from_account: sender account name
+        :param str to_account: recipient account name
+        """
+        memo_obj = _get_memo_class()(from_account=from_account, to_account=to_account, blockchain_instance=self)
+        return memo_obj.encrypt(memo)
+
+    def _format_amount(self, amount: float, symbol: str) -> str:
+        """
+        Serialize amount into backend representation like ``10.000 VIZ``.
+
+        :param float amount: amount to serialize
+        :param str symbol: asset symbol, e.g. ``core_symbol`` or ``shares_symbol`` from chain params
+        """
+        precision = PRECISIONS.get(symbol)
+        return f"{float(amount):.{precision}f} {symbol}"
+
     def new_proposal(
         self,
         title: str,
@@ -122,12 +230,7 @@ class Client(AbstractGrapheneChain):
         if not parent:
             parent = self.tx()
 
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         proposal = self.proposalbuilder_class(
             account,
@@ -165,12 +268,7 @@ class Client(AbstractGrapheneChain):
         :param str approve: True = approve, False = disapprove
         :param str account: the account that authorizes the operation
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         if approver:
             if not isinstance(approver, list):
@@ -191,7 +289,7 @@ class Client(AbstractGrapheneChain):
             keys = [PublicKey(key) for key in keys]
             payload["key_approvals_to_{}".format("add" if approve else "remove")] = keys
 
-        op = operations.Proposal_update(**{**payload, "author": author, "title": title, "extensions": []})
+        op = operations.Proposal_update({**payload, "author": author, "title": title, "extensions": []})
         return self.finalizeOp(op, account, permission)
 
     def transfer(
@@ -208,21 +306,14 @@ class Client(AbstractGrapheneChain):
         :param str account: (optional) the source account for the transfer
             if not ``default_account``
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         _amount = Amount("{} {}".format(amount, asset))
 
-        if memo and memo[0] == "#":
-            from .memo import Memo
+        if memo and memo.startswith("#"):
+            memo = self._encrypt_memo(memo, account, to)
 
-            memo_obj = Memo(from_account=account, to_account=to, blockchain_instance=self)
-            memo = memo_obj.encrypt(memo)
-
-        op = operations.Transfer(**{"from": account, "to": to, "amount": "{}".format(str(_amount)), "memo": memo})
+        op = operations.Transfer({"from": account, "to": to, "amount": str(_amount), "memo": memo})
 
         return self.finalizeOp(op, account, "active", **kwargs)
 
@@ -244,20 +335,16 @@ class Client(AbstractGrapheneChain):
         :param list beneficiaries: list of dicts, example ``[{'account': 'vvk', 'weight': 50}]``
         :param str account: initiator account name
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         if beneficiaries is None:
             beneficiaries = []
 
         op = operations.Award(
-            **{
+            {
                 "initiator": account,
                 "receiver": receiver,
-                "energy": int(energy * self.rpc.config['CHAIN_1_PERCENT']),
+                "energy": int(energy * self.chain_1_percent),
                 "custom_sequence": kwargs.get("custom_sequence", 0),
                 "memo": memo,
                 "beneficiaries": beneficiaries,
@@ -286,11 +373,7 @@ class Client(AbstractGrapheneChain):
         :param list beneficiaries: list of dicts, example ``[{'account': 'vvk', 'weight': 50}]``
         :param str account: initiator account name
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         if beneficiaries is None:
             beneficiaries = []
@@ -298,11 +381,11 @@ class Client(AbstractGrapheneChain):
         _amount = Amount("{} {}".format(reward_amount, "VIZ"))
 
         op = operations.Fixed_award(
-            **{
+            {
                 "initiator": account,
                 "receiver": receiver,
-                "reward_amount": "{}".format(str(_amount)),
-                "max_energy": int(max_energy * self.rpc.config['CHAIN_1_PERCENT']),
+                "reward_amount": str(_amount),
+                "max_energy": int(max_energy * self.chain_1_percent),
                 "custom_sequence": kwargs.get("custom_sequence", 0),
                 "memo": memo,
                 "beneficiaries": beneficiaries,
@@ -332,22 +415,19 @@ class Client(AbstractGrapheneChain):
         if required_regular_auths is None:
             required_regular_auths = []
 
-        if not isinstance(required_active_auths, list) or not isinstance(required_regular_auths, list):
+        if not (isinstance(required_active_auths, list) and isinstance(required_regular_auths, list)):
             raise ValueError("Expected list for required_active_auths or required_regular_auths")
 
-        account = None
-        required_key_type = "regular"
-
-        if len(required_active_auths):
-            account = required_active_auths[0]
-            required_key_type = "active"
-        elif len(required_regular_auths):
-            account = required_regular_auths[0]
+        # Signer selection: first non-empty auth list wins, active takes precedence
+        for auths, required_key_type in ((required_active_auths, "active"), (required_regular_auths, "regular")):
+            if auths:
+                account = auths[0]
+                break
         else:
             raise ValueError("At least one account needs to be specified")
 
         op = operations.Custom(
-            **{
+            {
                 "json": json,
                 "required_active_auths": required_active_auths,
                 "required_regular_auths": required_regular_auths,
@@ -363,20 +443,12 @@ class Client(AbstractGrapheneChain):
         :param float amount: number of SHARES to withdraw over a period
         :param str account: (optional) the source account for the transfer if not ``default_account``
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         op = operations.Withdraw_vesting(
-            **{
+            {
                 "account": account,
-                "vesting_shares": "{:.{prec}f} {asset}".format(
-                    float(amount),
-                    prec=PRECISIONS.get(self.rpc.chain_params["shares_symbol"]),
-                    asset=self.rpc.chain_params["shares_symbol"],
-                ),
+                "vesting_shares": self._format_amount(amount, self.shares_symbol),
             }
         )
 
@@ -390,24 +462,16 @@ class Client(AbstractGrapheneChain):
         :param str to: (optional) the source account for the transfer if not ``default_account``
         :param str account: (optional) the source account for the transfer if not ``default_account``
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         if not to:
             to = account  # powerup on the same account
 
         op = operations.Transfer_to_vesting(
-            **{
+            {
                 "from": account,
                 "to": to,
-                "amount": "{:.{prec}f} {asset}".format(
-                    float(amount),
-                    prec=PRECISIONS.get(self.rpc.chain_params["core_symbol"]),
-                    asset=self.rpc.chain_params["core_symbol"],
-                ),
+                "amount": self._format_amount(amount, self.core_symbol),
             }
         )
 
@@ -435,17 +499,13 @@ class Client(AbstractGrapheneChain):
             should receive the SHARES as SHARES, or false if it should
             receive them as CORE. (defaults to ``False``)
         """
-        if not account:
-            if "default_account" in self.config:
-                account = self.config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_account(account)
 
         op = operations.Set_withdraw_vesting_route(
-            **{
+            {
                 "from_account": account,
                 "to_account": to,
-                "percent": int(percentage * self.rpc.config['CHAIN_1_PERCENT']),
+                "percent": int(percentage * self.chain_1_percent),
                 "auto_vest": auto_vest,
             }
         )
@@ -633,16 +693,8 @@ class Client(AbstractGrapheneChain):
             delegation = required_fee * delegation_ratio * shares_price
 
         op = {
-            "fee": "{:.{prec}f} {asset}".format(
-                float(required_fee),
-                prec=PRECISIONS.get(self.rpc.chain_params["core_symbol"]),
-                asset=self.rpc.chain_params["core_symbol"],
-            ),
-            "delegation": "{:.{prec}f} {asset}".format(
-                float(delegation),
-                prec=PRECISIONS.get(self.rpc.chain_params["shares_symbol"]),
-                asset=self.rpc.chain_params["shares_symbol"],
-            ),
+            "fee": self._format_amount(required_fee, self.core_symbol),
+            "delegation": self._format_amount(delegation, self.shares_symbol),
             "creator": creator,
             "new_account_name": account_name,
             "master": {
@@ -666,7 +718,7 @@ class Client(AbstractGrapheneChain):
             "prefix": self.prefix,
         }
 
-        op = operations.Account_create(**op)
+        op = operations.Account_create(op)
 
         return self.finalizeOp(op, creator, "active")
 
@@ -701,7 +753,7 @@ class Client(AbstractGrapheneChain):
             "json_metadata": json_meta or {},
         }
 
-        op = operations.Account_update(**op)
+        op = operations.Account_update(op)
 
         return self.finalizeOp(ops=op, account=account_name, permission="active")
 
@@ -725,14 +777,10 @@ class Client(AbstractGrapheneChain):
         op = {
             "delegator": delegator,
             "delegatee": delegatee,
-            "vesting_shares": "{:.{prec}f} {asset}".format(
-                float(amount),
-                prec=PRECISIONS.get(self.rpc.chain_params["shares_symbol"]),
-                asset=self.rpc.chain_params["shares_symbol"],
-            ),
+            "vesting_shares": self._format_amount(amount, self.shares_symbol),
         }
 
-        op = operations.Delegate_vesting_shares(**op)
+        op = operations.Delegate_vesting_shares(op)
 
         return self.finalizeOp(op, delegator, "active")
 
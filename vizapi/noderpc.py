@@ -1,10 +1,14 @@
+import json
 import logging
-from threading import Lock
+import socket
 
+import requests
+from expiringdict import ExpiringDict
 from grapheneapi.api import Api as GrapheneApi
 from grapheneapi.http import Http as GrapheneHttp
 from grapheneapi.rpc import Rpc as GrapheneRpc
 from grapheneapi.websocket import Websocket as GrapheneWebsocket
+from requests.adapters import HTTPAdapter
 
 from vizbase.chains import KNOWN_CHAINS
 
@@ -13,6 +17,42 @@ from .consts import API
 
 log = logging.getLogger(__name__)
 
+# orjson parses node responses several times faster than stdlib json; install via the
+# 'orjson' extra, the stdlib is the fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(data, strict=False)
+
+
+# Reverse lookup to resolve a network by chain id without scanning KNOWN_CHAINS on each call
+CHAINS_BY_ID = {chain_data["chain_id"]: chain_data for chain_data in KNOWN_CHAINS.values()}
+
+# Read-only calls which may be served from a short-lived cache: results are either
+# immutable (blocks) or change slowly compared to the cache TTL
+CACHEABLE_CALLS = frozenset(
+    [
+        "get_block",
+        "get_block_header",
+        "get_hardfork_version",
+        "get_chain_properties",
+    ]
+)
+
+# Static part of the JSON-RPC envelope; copied per request and completed with params/id
+REQUEST_SKELETON = {"method": "call", "params": None, "jsonrpc": "2.0", "id": None}
+
+# Error message prefix -> exception dispatch table; extend it to map new node errors
+ERROR_PREFIXES = (
+    ("Missing Active Authority", exceptions.MissingRequiredAuthority),
+    ("Missing Master Authority", exceptions.MissingRequiredAuthority),
+    ("Missing Regular Authority", exceptions.MissingRequiredAuthority),
+    ("Missing Authority", exceptions.MissingRequiredAuthority),
+    ("Unable to acquire READ lock", exceptions.ReadLockFail),
+)
+
 
 class NodeRPC(GrapheneApi):
     """
@@ -31,9 +71,11 @@ class NodeRPC(GrapheneApi):
     """
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        # Caches should exist before super().__init__() connects and queries the network
         self._network = None
-        self.config = None
+        self._config = None
+        self._call_cache = ExpiringDict(max_len=1024, max_age_seconds=kwargs.pop("call_cache_ttl", 60))
+        super().__init__(*args, **kwargs)
 
     def post_process_exception(self, error: Exception) -> None:
         """
@@ -48,28 +90,87 @@ class NodeRPC(GrapheneApi):
             raise
 
         msg = exceptions.decode_rpc_error_msg(error)
-        if (
-            msg.startswith("Missing Active Authority")
-            or msg.startswith("Missing Master Authority")
-            or msg.startswith("Missing Authority")
-            or msg.startswith("Missing Regular Authority")
-        ):
-            raise exceptions.MissingRequiredAuthority(msg)
-        elif msg == "Unable to acquire READ lock":
-            raise exceptions.ReadLockFail(msg)
-        elif msg:
+        for prefix, exception_class in ERROR_PREFIXES:
+            if msg.startswith(prefix):
+                raise exception_class(msg)
+        if msg:
             raise exceptions.UnhandledRPCError(msg)
         else:
             raise error
 
+    @property
+    def config(self):
+        """
+        Cached config of the connected node, accessible as ``blockchain_instance.rpc.config``.
+
+        Config is constant for a connection lifetime, so it is fetched once and re-fetched lazily after
+        a reconnect invalidated the cache.
+        """
+        if self._config is None:
+            self._config = super().__getattr__("get_config")()
+        return self._config
+
+    def get_config(self):
+        """Return the node config; see :py:attr:`config` for the caching behavior."""
+        return self.config
+
+    def invalidate_network_cache(self):
+        """Drop cached config, network info and call cache; used on reconnect."""
+        self._config = None
+        self._network = None
+        self._call_cache.clear()
+
+    def __getattr__(self, name):
+        """Serve whitelisted read-only calls from the TTL cache, proxy the rest as usual."""
+        func = super().__getattr__(name)
+        if name not in CACHEABLE_CALLS:
+            return func
+
+        def cached_func(*args, **kwargs):
+            if kwargs:
+                return func(*args, **kwargs)
+            key = (name, args)
+            try:
+                result = self._call_cache[key]
+            except KeyError:
+                result = func(*args)
+                # Empty results (e.g. a block that is not produced yet) must not
+                # be served from the cache for the whole TTL
+                if result:
+                    self._call_cache[key] = result
+            # Shallow copy: callers update top-level keys in place (e.g.
+            # Blockchain.blocks() adds block_num), which must not leak into the cache
+            if isinstance(result, dict):
+                return dict(result)
+            if isinstance(result, list):
+                return list(result)
+            return result
+
+        return cached_func
+
     def updated_connection(self):
-        if self.url[:2] == "ws":
-            # Use own Websocket class
-            return Websocket(self.url, **self._kwargs)
-        elif self.url[:4] == "http":
-            return Http(self.url, **self._kwargs)
-        else:
-            raise ValueError("Only support http(s) and ws(s) connections!")
+        self.invalidate_network_cache()
+        # Pool transports per URL so switching between nodes (and back) reuses
+        # the long-lived connection instead of instantiating a new one
+        connection = self._connections.get(self.url)
+        if connection is None:
+            if self.url[:2] == "ws":
+                # Use own Websocket class
+                connection = Websocket(self.url, **self._kwargs)
+            elif self.url[:4] == "http":
+                connection = Http(self.url, **self._kwargs)
+            else:
+                raise ValueError("Only support http(s) and ws(s) connections!")
+            self._connections[self.url] = connection
+        return connection
+
+    def batch(self):
+        """
+        Start a batch of RPC calls on the active connection.
+
+        Shortcut for :py:meth:`Rpc.batch` of the underlying connection. See :py:class:`BatchRpc` for usage example.
+        """
+        return self.connection.batch()
 
     def get_network(self):
         """
@@ -88,14 +189,108 @@ class NodeRPC(GrapheneApi):
 
         This call returns a dictionary with keys chain_id, core_symbol and prefix
         """
-        # Cache config into self.config to be accesible as
-        # blockchain_instance.rpc.config
-        self.config = self.get_config()
         chain_id = self.config["CHAIN_ID"]
-        for _, chain_data in KNOWN_CHAINS.items():
-            if chain_data["chain_id"] == chain_id:
-                return chain_data
-        raise exceptions.UnknownNetwork("Connecting to unknown network!")
+        try:
+            return CHAINS_BY_ID[chain_id]
+        except KeyError:
+            raise exceptions.UnknownNetwork("Connecting to unknown network!")
+
+
+class BatchedCall:
+    """
+    Future-like handle for a single call queued via :py:class:`BatchRpc`.
+
+    The result becomes available after the whole batch is sent, i.e. after leaving the ``with`` block.
+    """
+
+    def __init__(self):
+        self._resolved = False
+        self._result = None
+        self._exception = None
+
+    def resolve(self, result):
+        self._resolved = True
+        self._result = result
+
+    def reject(self, exception):
+        self._resolved = True
+        self._exception = exception
+
+    def result(self):
+        """Return the call result, raising the per-call RPC error if the node returned one."""
+        if not self._resolved:
+            raise RuntimeError("Batch was not executed yet; use result() after leaving the `with` block")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+class BatchRpc:
+    """
+    Accumulate RPC calls and send them as a single JSON-RPC 2.0 batch request.
+
+    Each method call enqueues a query and returns a :py:class:`BatchedCall` handle; the whole queue is sent in one
+    round trip when the context manager exits.
+
+    .. code-block:: python
+
+        with viz.rpc.batch() as batch:
+            props = batch.get_dynamic_global_properties()
+            config = batch.get_config()
+        print(props.result(), config.result())
+    """
+
+    def __init__(self, rpc):
+        self._rpc = rpc
+        self._queue = []
+        self._handles = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+        return False
+
+    def __getattr__(self, name):
+        """Map all methods to queued RPC calls and pass through the arguments."""
+
+        def method(*args, **kwargs):
+            api = kwargs.get("api", API.get(name))
+            if not api:
+                raise exceptions.NoSuchAPI('Cannot find API for you request "{}"'.format(name))
+
+            # Fix wrong api name hardcoded in graphenecommon.TransactionBuilder
+            if api == "network_broadcast":
+                api = "network_broadcast_api"
+
+            query = dict(REQUEST_SKELETON)
+            query["params"] = [api, name, list(args)]
+            query["id"] = self._rpc.get_request_id()
+            handle = BatchedCall()
+            self._queue.append(query)
+            self._handles[query["id"]] = handle
+            return handle
+
+        return method
+
+    def execute(self):
+        """Send all queued calls as a single batch and resolve their handles."""
+        if not self._queue:
+            return
+        queries, self._queue = self._queue, []
+        handles, self._handles = self._handles, {}
+        log.debug(queries)
+        response = self._rpc.rpcexec(queries)
+        if not isinstance(response, list):
+            response = _json_loads(response)
+        for element in response:
+            handle = handles[element["id"]]
+            try:
+                handle.resolve(self._rpc.parse_response(element))
+            except Exception as e:
+                handle.reject(e)
 
 
 class Rpc(GrapheneRpc):
@@ -106,13 +301,41 @@ class Rpc(GrapheneRpc):
     """
 
     def __init__(self, *args, **kwargs):
-        super(Rpc, self).__init__(*args, **kwargs)
+        super().__init__(*args, **kwargs)
+        self._method_cache = {}
+
+    def batch(self):
+        """
+        Return a :py:class:`BatchRpc` context manager collapsing multiple calls into one round trip.
+        """
+        return BatchRpc(self)
+
+    def parse_response(self, query, log_on_debug=True):
+        """Decode the node response with orjson when available, then let graphene handle the rest."""
+        if not isinstance(query, dict):
+            try:
+                query = _json_loads(query)
+            except ValueError:
+                raise ValueError("Client returned invalid format. Expected JSON!")
+        return super().parse_response(query, log_on_debug=log_on_debug)
 
     def __getattr__(self, name):
         """Map all methods to RPC calls and pass through the arguments."""
+        # Defensive: __getattr__ may fire before __init__ has run (e.g. during unpickling)
+        cache = self.__dict__.setdefault("_method_cache", {})
+        method = cache.get(name)
+        if method is None:
+            method = cache[name] = self._make_method(name)
+        return method
+
+    def _make_method(self, name):
+        """Build the RPC method callable for ``name``; built once per name and cached."""
+        default_api = API.get(name)
 
         def method(*args, **kwargs):
-            api = kwargs.get("api", API.get(name))
+            # kwargs are only passed for the rare per-call 'api' override;
+            # the common path resolves the api at method-construction time
+            api = kwargs.get("api", default_api) if kwargs else default_api
             if not api:
                 raise exceptions.NoSuchAPI('Cannot find API for you request "{}"'.format(name))
 
@@ -120,12 +343,9 @@ class Rpc(GrapheneRpc):
             if api == "network_broadcast":
                 api = "network_broadcast_api"
 
-            query = {
-                "method": "call",
-                "params": [api, name, list(args)],
-                "jsonrpc": "2.0",
-                "id": self.get_request_id(),
-            }
+            query = dict(REQUEST_SKELETON)
+            query["params"] = [api, name, list(args)]
+            query["id"] = self.get_request_id()
             log.debug(query)
             while True:
                 try:
@@ -145,23 +365,42 @@ class Websocket(GrapheneWebsocket, Rpc):
     Interface to API node websocket endpoint.
 
     We have to override Websocket class because we need it to inherit from our own Rpc class.
-    """
-
-    def __init__(self, *args, **kwargs):
-        super(Rpc, self).__init__(*args, **kwargs)
 
-        # We don't initializing GrapheneWebsocket, so we need to double it's code
+    No own ``__init__`` is needed: the cooperative ``super()`` chain runs the graphene Websocket
+    initialization (including its rpcexec lock) and our :py:class:`Rpc` one.
+    """
 
-        # We need a lock to ensure thread-safty
-        self.__lock = Lock()
+    def connect(self):
+        super().connect()
+        # Disable Nagle's algorithm: RPC exchanges are small request/response
+        # payloads, and coalescing them only adds round-trip latency
+        try:
+            self.ws.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError):  # pragma: no cover
+            pass
 
 
 class Http(GrapheneHttp, Rpc):
     """
     Interface to API node http endpoint.
 
-    We have to override Websocket class because we need it to inherit from our own Rpc class.
+    We have to override Http class because we need it to inherit from our own Rpc class.
     """
 
-    def __init__(self, *args, **kwargs):
-        super(Rpc, self).__init__(*args, **kwargs)
+    def get_request_session(self) -> requests.Session:
+        """
+        Reuse a single keep-alive session for all requests to this node.
+
+        Compared to the graphene base, the adapter is mounted with a larger connection pool so concurrent
+        callers do not serialize on a single pooled socket.
+        """
+        if self.__request_session is None:
+            session = requests.Session()
+            session.proxies.update(self.proxies())
+            session.headers["Connection"] = "keep-alive"
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self.__request_session = session
+
+        return self.__request_session